@@ -3,4 +3,10 @@ from .indeterminate import Indeterminate
 from .polynomial import Monomial, Polynomial
 from .number import real
 
-__all__ = ["Indeterminate", "Monomial", "Polynomial"]
+# The compiled kernels need numba, which is optional.
+try:
+    from ._kernels import warmup
+except ImportError:
+    from ._fallback import warmup
+
+__all__ = ["Indeterminate", "Monomial", "Polynomial", "warmup"]
@@ -0,0 +1,37 @@
+"""Pure NumPy stand-ins for the compiled kernels in _kernels.
+
+Used when numba isn't installed. They take and return the same structure-of-arrays
+layout as the kernels, but may leave repeat rows for Polynomial to consolidate.
+"""
+
+import numpy as np
+
+
+def poly_mul(exp_a: np.ndarray,
+             coef_a: np.ndarray,
+             exp_b: np.ndarray,
+             coef_b: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Multiply two polynomials given as exponent matrices over the same var index.
+
+    Every pair of rows gives a product monomial: add the exponent rows and multiply
+    the coefficients, all at once via broadcasting.
+
+    Args:
+        exp_a (np.ndarray): Exponent matrix of the first polynomial.
+        coef_a (np.ndarray): Coefficient vector of the first polynomial.
+        exp_b (np.ndarray): Exponent matrix of the second polynomial.
+        coef_b (np.ndarray): Coefficient vector of the second polynomial.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Exponent matrix and coefficient vector of all
+            n_a*n_b products, possibly with repeat rows.
+    """
+    n_products = exp_a.shape[0] * exp_b.shape[0]
+    exponents = (exp_a[:, np.newaxis, :]
+                 + exp_b[np.newaxis, :, :]).reshape(n_products, exp_a.shape[1])
+    coefficients = np.outer(coef_a, coef_b).ravel()
+    return exponents, coefficients
+
+
+def warmup() -> None:
+    """Do nothing, since there is nothing to compile without numba."""
@@ -0,0 +1,201 @@
+"""Compiled kernels for polynomial arithmetic on exponent matrices.
+
+These operate on the structure-of-arrays layout used by Polynomial: an int64 exponent
+matrix of shape (n_monomials, n_vars) and a float64 coefficient vector. They require
+numba; importing this module raises ImportError if it isn't installed, in which case
+Polynomial falls back to _fallback.poly_mul.
+"""
+
+import numpy as np
+from numba import njit, types
+from numba.typed import Dict
+
+# Exponent rows can be packed into a single int64 fingerprint when there are at most
+# this many indeterminates, each with exponent fitting in 8 bits. Every column gets a
+# lane, unlike the grevlex keys in polynomial.py, whose limits are independent of these.
+PACKED_MAX_VARS = 8
+PACKED_MAX_EXPONENT = 255
+
+
+@njit(cache=True)
+def _product_greater(exp_a: np.ndarray, # noqa: PLR0913
+                     deg_a: np.ndarray,
+                     exp_b: np.ndarray,
+                     deg_b: np.ndarray,
+                     i1: int, j1: int, i2: int, j2: int) -> bool:
+    """Test whether the product a[i1]*b[j1] is greater than a[i2]*b[j2] in grevlex."""
+    degree_1, degree_2 = deg_a[i1] + deg_b[j1], deg_a[i2] + deg_b[j2]
+    if degree_1 != degree_2:
+        return degree_1 > degree_2
+    for col in range(exp_a.shape[1] - 1, -1, -1):
+        exponent_1 = exp_a[i1, col] + exp_b[j1, col]
+        exponent_2 = exp_a[i2, col] + exp_b[j2, col]
+        if exponent_1 != exponent_2:
+            return exponent_1 < exponent_2
+    return False
+
+
+@njit(cache=True)
+def _products_heap(exp_a: np.ndarray,
+                   coef_a: np.ndarray,
+                   exp_b: np.ndarray,
+                   coef_b: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Multiply two polynomials by a heap-based merge of their products.
+
+    This is Johnson's algorithm. Both exponent matrices must be in descending grevlex
+    order. Since grevlex is multiplicative, each row a[i] gives a descending stream
+    of products a[i]*b[0], a[i]*b[1], ...; a max-heap holding the head of every
+    stream yields all products in descending order, so equal products come out
+    adjacent and merge on the fly. The output is consolidated and in descending
+    grevlex order, and only uses memory proportional to its size plus n_a.
+    """
+    n_a, n_b, n_vars = exp_a.shape[0], exp_b.shape[0], exp_a.shape[1]
+    deg_a = exp_a.sum(axis=1).astype(np.int64)
+    deg_b = exp_b.sum(axis=1).astype(np.int64)
+
+    # The heap holds the (i, j) index of the head of each stream. Initially the heads
+    # are the a[i]*b[0], which are already in descending order, hence a valid heap.
+    heap_i = np.arange(n_a)
+    heap_j = np.zeros(n_a, np.int64)
+    size = n_a if n_b > 0 else 0
+
+    capacity = max(n_a + n_b, 1)
+    out_exp = np.empty((capacity, n_vars), np.int64)
+    out_coef = np.empty(capacity, np.float64)
+    n_out = 0
+    while size > 0:
+        i, j = heap_i[0], heap_j[0]
+        if n_out == capacity:
+            capacity *= 2
+            grown_exp = np.empty((capacity, n_vars), np.int64)
+            grown_exp[:n_out] = out_exp
+            grown_coef = np.empty(capacity, np.float64)
+            grown_coef[:n_out] = out_coef
+            out_exp, out_coef = grown_exp, grown_coef
+
+        # Write the product into the next free row, then keep it only if it differs
+        # from the previous one.
+        out_exp[n_out] = exp_a[i] + exp_b[j]
+        if n_out > 0 and np.array_equal(out_exp[n_out], out_exp[n_out - 1]):
+            out_coef[n_out - 1] += coef_a[i] * coef_b[j]
+        else:
+            out_coef[n_out] = coef_a[i] * coef_b[j]
+            n_out += 1
+
+        # Replace the head with its successor in the same stream, or drop the stream.
+        if j + 1 < n_b:
+            heap_j[0] = j + 1
+        else:
+            size -= 1
+            heap_i[0], heap_j[0] = heap_i[size], heap_j[size]
+
+        # Sift the new head down.
+        pos = 0
+        while True:
+            child = 2*pos + 1
+            if child >= size:
+                break
+            if child + 1 < size and _product_greater(
+                    exp_a, deg_a, exp_b, deg_b,
+                    heap_i[child + 1], heap_j[child + 1], heap_i[child], heap_j[child]):
+                child += 1
+            if not _product_greater(exp_a, deg_a, exp_b, deg_b,
+                                    heap_i[child], heap_j[child],
+                                    heap_i[pos], heap_j[pos]):
+                break
+            heap_i[pos], heap_i[child] = heap_i[child], heap_i[pos]
+            heap_j[pos], heap_j[child] = heap_j[child], heap_j[pos]
+            pos = child
+
+    return out_exp[:n_out], out_coef[:n_out]
+
+
+@njit(cache=True)
+def _pack_rows(exponents: np.ndarray) -> np.ndarray:
+    """Pack each exponent row into an int64 fingerprint, 8 bits per indeterminate."""
+    n, n_vars = exponents.shape
+    keys = np.zeros(n, np.int64)
+    for row in range(n):
+        for col in range(n_vars):
+            keys[row] = (keys[row] << 8) | np.int64(exponents[row, col])
+    return keys
+
+
+@njit(cache=True)
+def _products_packed(exp_a: np.ndarray,
+                     coef_a: np.ndarray,
+                     exp_b: np.ndarray,
+                     coef_b: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Form every pairwise product of monomials, merging equal ones as they appear.
+
+    Only valid when the product rows fit in PACKED_MAX_VARS lanes of 8 bits each.
+    Then the fingerprint of a product is the sum of its factors' fingerprints, and
+    the products accumulate into a dict without ever materializing all n_a*n_b.
+    """
+    n_vars = exp_a.shape[1]
+    keys_a, keys_b = _pack_rows(exp_a), _pack_rows(exp_b)
+    accumulator = Dict.empty(key_type=types.int64, value_type=types.float64)
+    for i in range(keys_a.shape[0]):
+        for j in range(keys_b.shape[0]):
+            key = keys_a[i] + keys_b[j]
+            if key in accumulator:
+                accumulator[key] += coef_a[i] * coef_b[j]
+            else:
+                accumulator[key] = coef_a[i] * coef_b[j]
+
+    # Unpack the fingerprints back into exponent rows.
+    out_exp = np.empty((len(accumulator), n_vars), np.int64)
+    out_coef = np.empty(len(accumulator), np.float64)
+    for row, (key, coefficient) in enumerate(accumulator.items()):
+        lanes = key
+        for col in range(n_vars - 1, -1, -1):
+            out_exp[row, col] = lanes & 0xFF
+            lanes >>= 8
+        out_coef[row] = coefficient
+    return out_exp, out_coef
+
+
+def poly_mul(exp_a: np.ndarray,
+             coef_a: np.ndarray,
+             exp_b: np.ndarray,
+             coef_b: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Multiply two polynomials given as exponent matrices over the same var index.
+
+    Both exponent matrices must be in descending grevlex order, as Polynomial keeps
+    them.
+
+    Args:
+        exp_a (np.ndarray): Exponent matrix of the first polynomial.
+        coef_a (np.ndarray): Coefficient vector of the first polynomial.
+        exp_b (np.ndarray): Exponent matrix of the second polynomial.
+        coef_b (np.ndarray): Coefficient vector of the second polynomial.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Exponent matrix and coefficient vector of the
+            product, with no repeat rows.
+    """
+    # Sum exponents in int64, and add the maxima in Python ints, so that neither
+    # can wrap around into the packable range.
+    exp_a = exp_a.astype(np.int64, copy=False)
+    exp_b = exp_b.astype(np.int64, copy=False)
+    max_exponent = int(exp_a.max(initial=0)) + int(exp_b.max(initial=0))
+    if exp_a.shape[1] <= PACKED_MAX_VARS and max_exponent <= PACKED_MAX_EXPONENT:
+        return _products_packed(exp_a, coef_a, exp_b, coef_b)
+
+    # Otherwise, merge with a heap over the rows of the smaller operand.
+    if exp_a.shape[0] > exp_b.shape[0]:
+        exp_a, coef_a, exp_b, coef_b = exp_b, coef_b, exp_a, coef_a
+    return _products_heap(exp_a, coef_a, exp_b, coef_b)
+
+
+def warmup() -> None:
+    """Compile the kernels now, rather than on their first use.
+
+    Runs poly_mul once down each of its paths, on arrays of the types Polynomial
+    passes. Since the kernels are compiled with cache=True, only the first call per
+    installation takes long; after that, this loads them from __pycache__.
+    """
+    coefficients = np.ones(1, np.float64)
+    for exponent in (1, PACKED_MAX_EXPONENT):
+        exponents = np.full((1, 1), exponent, np.int64)
+        poly_mul(exponents, coefficients, exponents, coefficients)
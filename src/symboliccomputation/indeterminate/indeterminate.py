@@ -1,25 +1,81 @@
 """A way to store indeterminates, or the atoms of this package."""
 
-import re
-from dataclasses import dataclass
+from functools import total_ordering
+from typing import Self
 
+# All indeterminates created so far, by name.
+_INTERN: dict[str, "Indeterminate"] = {}
 
-@dataclass(frozen=True, order=True)
+
+@total_ordering
 class Indeterminate:
     """An indeterminate.
 
     Like $x$, to be used in a mathematical expression, where it doesn't
     represent a specific value.
+
+    Indeterminates are immutable and interned: constructing one with a name that has
+    been seen before returns the existing instance, so equal indeterminates are
+    usually the same object.
     """
 
-    name: str = "x"
+    __slots__ = ("name",)
 
-    def __post_init__(self) -> None:
-        """Ban indeterminate names from starting with numbers.
+    name: str
 
-        This has the effect of banning monomials initialized like '12345x' (correct
-        initialization string would be '12345*x').
+    def __new__(cls, name: str = "x") -> Self:
+        """Get the indeterminate with the given name, creating it if needed.
+
+        Ban indeterminate names from being empty or starting with numbers. The latter
+        has the effect of banning monomials initialized like '12345x' (correct
+        initialization string would be '12345*x'). The checks only run the first time
+        a name is seen.
         """
-        if re.match(r"^\d", self.name):
-            value_error_msg = f"Invalid name '{self.name}': must not start w/ digit."
+        indeterminate = _INTERN.get(name)
+        if indeterminate is not None:
+            return indeterminate
+
+        if not name:
+            value_error_msg = "Invalid name '': must not be empty."
             raise ValueError(value_error_msg)
+        if name[0].isdigit():
+            value_error_msg = f"Invalid name '{name}': must not start w/ digit."
+            raise ValueError(value_error_msg)
+
+        indeterminate = super().__new__(cls)
+        object.__setattr__(indeterminate, "name", name)
+        return _INTERN.setdefault(name, indeterminate)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Indeterminates are immutable."""
+        attribute_error_msg = f"cannot assign to field '{name}'"
+        raise AttributeError(attribute_error_msg)
+
+    def __delattr__(self, name: str) -> None:
+        """Indeterminates are immutable."""
+        attribute_error_msg = f"cannot delete field '{name}'"
+        raise AttributeError(attribute_error_msg)
+
+    def __reduce__(self) -> tuple[type[Self], tuple[str]]:
+        """Pickle and copy by name, so that the result is interned too."""
+        return (type(self), (self.name,))
+
+    def __eq__(self, other: object) -> bool:
+        """Test equality of two indeterminates, usually by identity."""
+        if not isinstance(other, Indeterminate):
+            return NotImplemented
+        return self is other or self.name == other.name
+
+    def __lt__(self, other: object) -> bool:
+        """Order indeterminates by name."""
+        if not isinstance(other, Indeterminate):
+            return NotImplemented
+        return self.name < other.name
+
+    def __hash__(self) -> int:
+        """To use this class in a set, need to be able to compute a hash."""
+        return hash(self.name)
+
+    def __repr__(self) -> str:
+        """Produce a string representation of the object."""
+        return f"Indeterminate(name={self.name!r})"
@@ -2,19 +2,18 @@
 
 import math
 
-import numpy as np
 
 class Rational:
     """A rational number a/b.
     """
 
-    numerator: np.int64
-    denominator: np.int64
+    numerator: int
+    denominator: int
 
     def __init__(self,
-                 numerator: np.int64 | None = None,
-                 denominator: np.int64 | None = None,
-                 decimal: np.float64 | None = None) -> None:
+                 numerator: int | None = None,
+                 denominator: int | None = None,
+                 decimal: float | None = None) -> None:
         """Constructs a rational number in simplified form.
 
         At least one of (numerator/denominator) and decimal should be None.
@@ -22,45 +21,44 @@ class Rational:
         numerator.
 
         Args:
-            numerator (np.int64 | None): The numerator.
-            denominator (np.int64 | None): The denominator.
-            decimal (np.float64 | None): The decimal representation of the number.
+            numerator (int | None): The numerator.
+            denominator (int | None): The denominator.
+            decimal (float | None): The decimal representation of the number.
         Raises:
             ValueError: If incorrect combinations of arguments are given.
-            ZeroDivisionError: If denominator is 0 (or close to it).
+            ZeroDivisionError: If denominator is 0.
         """
         if decimal is None:
             if numerator is None or denominator is None:
                 value_error_msg = "Error: if decimal is None, num/denom must not be."
                 raise ValueError(value_error_msg)
-            if np.isclose(denominator, np.int64(0)):
+            if denominator == 0:
                 raise ZeroDivisionError
 
-            numerator, denominator = np.int64(numerator), np.int64(denominator)
+            numerator, denominator = int(numerator), int(denominator)
             gcd = math.gcd(numerator, denominator)
 
-            if denominator < 0.:
-                numerator *= -1.
-                denominator *= -1.
+            if denominator < 0:
+                numerator, denominator = -numerator, -denominator
 
-            self.numerator = np.int64(numerator / gcd)
-            self.denominator = np.int64(denominator / gcd)
+            self.numerator = numerator // gcd
+            self.denominator = denominator // gcd
         else:
             if numerator is not None or denominator is not None:
                 value_error_msg = "if decimal is not None, num/denom must be."
                 raise ValueError(value_error_msg)
             
-            decimal = np.float64(decimal)
+            decimal = float(decimal)
             decimal_str = str(decimal)
             sig_figs = decimal_str[::-1].find(".")
             ten_appropriate_power = 10**sig_figs
 
-            self.numerator = np.int64(decimal*ten_appropriate_power)
-            self.denominator = np.int64(ten_appropriate_power)
+            self.numerator = int(decimal*ten_appropriate_power)
+            self.denominator = ten_appropriate_power
             
 
     def simplify(self) -> None:
         """Simplify the rational number in-place."""
         gcd = math.gcd(self.numerator, self.denominator)
-        self.numerator /= gcd
-        self.denominator /= gcd
\ No newline at end of file
+        self.numerator //= gcd
+        self.denominator //= gcd
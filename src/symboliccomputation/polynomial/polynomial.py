@@ -1,24 +1,57 @@
 """A way to store and manipulate polynomials involving indeterminates."""
 
 import re
-from typing import Self
+from functools import total_ordering
+from typing import Literal, Self
 
 import numpy as np
 
 from symboliccomputation.indeterminate import Indeterminate
 
+# The compiled kernels need numba, which is optional.
+try:
+    from symboliccomputation._kernels import poly_mul
+except ImportError:
+    from symboliccomputation._fallback import poly_mul
 
+
+_DIGITS = frozenset("0123456789")
+
+# Exponents are stored as int64.
+MAX_EXPONENT = np.iinfo(np.int64).max
+
+# Exponent matrices can be packed into one uint64 grevlex key per row when they have
+# at most this many columns and total degree. The first column's exponent is implied
+# by the total degree, so it doesn't need a lane of its own. These are independent of
+# the packing limits in _kernels, which has no implied column.
+GREVLEX_KEY_MAX_VARS = 8
+GREVLEX_KEY_MAX_DEGREE = 255
+
+# The supported monomial orders, with the indeterminates ordered by name.
+type MonomialOrder = Literal["lex", "grlex", "grevlex"]
+
+
+@total_ordering
 class Monomial:
-    """A monomial, like '-3*x^2*y^2'."""
+    """A monomial, like '-3*x^2*y^2'.
+
+    Monomials are ordered by grevlex on their weight vectors, with the
+    indeterminates ordered by name; monomials with the same weight vector are
+    ordered by coefficient.
+    """
 
-    # TODO(Nicholas): Monomial order comparisons given ordering, option to print
-    # using given ordering,
+    # TODO(Nicholas): option to print using given ordering,
     # 003
 
-    MONOMIAL_REGEX = re.compile(r"^(-\d+)?\d*(\.\d+)?([a-z]+(\^[1-9]\d*)?)?(\*[a-z]+(\^[1-9]\d*)?)*$") # noqa: E501
+    MONOMIAL_REGEX = re.compile(r"^(?=.)(-\d+)?\d*(\.\d+)?([a-z]+(\^[1-9]\d*)?)?(\*[a-z]+(\^[1-9]\d*)?)*$") # noqa: E501
 
-    coefficient: np.int64 | np.float64 # Only real numbers allowed right now
-    weight_dict: dict[Indeterminate, np.int64]
+    __slots__ = ("_degree", "_hash", "_key", "coefficient", "weight_dict")
+
+    coefficient: float # Only real numbers allowed right now
+    weight_dict: dict[Indeterminate, int]
+    _key: tuple[float, tuple[tuple[Indeterminate, int], ...]]
+    _hash: int
+    _degree: int
 
     def __init__(self, monomial: str) -> None:
         """Initialize an instance of the Monomial class.
@@ -29,44 +62,193 @@ class Monomial:
         Args:
             monomial (str): The monomial desired, written like '-3*x^2*y^2'.
         """
-        # Determine whether the given string is a valid monomial expression.
-        if not Monomial.is_valid_monomial_regex(monomial):
-            # ValueError string to avoid duplication in traceback.
+        scanned = Monomial._scan_monomial_string(monomial)
+        if scanned is None:
             value_error_msg = "Invalid monomial expression!"
             raise ValueError(value_error_msg)
+        coefficient, weights = scanned
+        self.coefficient = coefficient
+
+        # Determine the monomial's weight vector.
+        self.weight_dict = Monomial._weight_dict(weights)
+
+        self._init_key()
+
+    @staticmethod
+    def _scan_monomial_string(monomial: str) -> tuple[float,
+                                                      list[tuple[str, int]]] | None:
+        """Parse a monomial string in a single forward scan, without regex.
+
+        Accepts exactly the strings matched by MONOMIAL_REGEX: an optional
+        coefficient, then indeterminates separated by "*", each with an optional
+        exponent "^n", n >= 1. Repeat indeterminates are left in, to be caught by
+        _weight_dict.
+
+        Args:
+            monomial (str): The monomial string, like '-3*x^2*y^2'.
 
-        # Split the monomial string by "*", so each list element should be
-        # something like either a number or an indeterminate raised to a power.
-        monomial_split_by_asterisk = monomial.split("*")
+        Returns:
+            tuple[float, list[tuple[str, int]]] | None: The coefficient, and the
+                (indeterminate name, exponent) pairs sorted by name; or None if the
+                string isn't a valid monomial expression.
+        """
+        # The empty string would otherwise be read as the constant 1.
+        if not monomial:
+            return None
 
-        # Remove and store the monomial's coefficient, if it has one.
-        try:
-            np.float64(monomial_split_by_asterisk[0])
-            self.coefficient = np.float64(monomial_split_by_asterisk.pop(0))
-        except ValueError:
-            self.coefficient = np.float64(1.)
+        pos = Monomial._scan_coefficient(monomial)
+        if pos is None:
+            return None
 
-        # Sort the list according to indeterminate name.
-        monomial_split_by_asterisk.sort()
+        # A coefficient written directly against an indeterminate, like '12345x', is
+        # read as part of the name, which Indeterminate then rejects.
+        coefficient = 1.
+        if pos and not monomial[pos:pos + 1].isalpha():
+            coefficient = float(monomial[:pos])
 
-        # Split each list element at "^", so each element of the list is
-        # [indeterminate, exponent].
-        monomial_fully_split = [elt.split("^") for elt in monomial_split_by_asterisk]
+        weights = Monomial._scan_factors(monomial, pos)
+        if weights is None:
+            return None
+        return coefficient, weights
 
-        # If any indeterminates have no exponent, make them have exponent 1.
-        monomial_fully_split_ones_added = [
-            [*elt, "1"] if len(elt) == 1 else elt for elt in monomial_fully_split
-        ]
+    @staticmethod
+    def _scan_coefficient(monomial: str) -> int | None:
+        """Scan the coefficient at the start of a monomial string.
 
-        # Determine all the monomial's indeterminates and raise error if any repeats.
-        indeterminate_string_list = [elt[0] for elt in monomial_fully_split_ones_added]
-        if len(list(set(indeterminate_string_list))) != len(indeterminate_string_list):
+        The coefficient is (-digits)? digits (.digits)?, and may be empty.
+
+        Args:
+            monomial (str): The monomial string, like '-3*x^2*y^2'.
+
+        Returns:
+            int | None: The position just past the coefficient, which is 0 if there is
+                none; or None if the coefficient is malformed.
+        """
+        n = len(monomial)
+        negative = monomial.startswith("-")
+        pos = 1 if negative else 0
+        while pos < n and monomial[pos] in _DIGITS:
+            pos += 1
+        if negative and pos == 1:
+            return None
+        if pos < n and monomial[pos] == ".":
+            pos += 1
+            digits_start = pos
+            while pos < n and monomial[pos] in _DIGITS:
+                pos += 1
+            if digits_start == pos:
+                return None
+        return pos
+
+    @staticmethod
+    def _scan_factors(monomial: str, pos: int) -> list[tuple[str, int]] | None:
+        """Scan the indeterminates of a monomial string, from just past its coefficient.
+
+        Each is [*]name(^exponent)?, with "*" required after the first one, and is
+        found with str.find and checked with str methods.
+
+        Args:
+            monomial (str): The monomial string, like '-3*x^2*y^2'.
+            pos (int): The position just past the coefficient.
+
+        Returns:
+            list[tuple[str, int]] | None: The (indeterminate name, exponent) pairs
+                sorted by name; or None if the indeterminates are malformed.
+        """
+        n = len(monomial)
+        weights = []
+        in_order = True
+        while pos < n:
+            if monomial[pos] == "*":
+                pos += 1
+                name_start = pos
+            elif not weights:
+                name_start = 0
+            else:
+                return None
+
+            factor_end = monomial.find("*", pos)
+            factor_end = n if factor_end == -1 else factor_end
+            name_end = monomial.find("^", pos, factor_end)
+            name_end = factor_end if name_end == -1 else name_end
+            letters = monomial[pos:name_end]
+            if not (letters.isascii() and letters.isalpha() and letters.islower()):
+                return None
+            name = monomial[name_start:name_end]
+
+            exponent = 1
+            if name_end < factor_end:
+                exponent_str = monomial[name_end + 1:factor_end]
+                if not (exponent_str.isascii() and exponent_str.isdigit()) \
+                or exponent_str[0] == "0":
+                    return None
+                exponent = int(exponent_str)
+
+            if weights and weights[-1][0] >= name:
+                in_order = False
+            weights.append((name, exponent))
+            pos = factor_end
+
+        # Only sort according to indeterminate name if not written in order already.
+        if not in_order:
+            weights.sort()
+
+        return weights
+
+    @staticmethod
+    def _weight_dict(weights: list[tuple[str, int]]) -> dict[Indeterminate, int]:
+        """Build a weight vector from the pairs found by _scan_monomial_string.
+
+        Args:
+            weights (list[tuple[str, int]]): The (indeterminate name, exponent) pairs.
+
+        Raises:
+            ValueError: If an indeterminate repeats.
+
+        Returns:
+            dict[Indeterminate, int]: The weight vector.
+        """
+        # Check the names before making any Indeterminates, which validate them.
+        if len(dict(weights)) != len(weights):
             value_error_msg = "Invalid monomial expression: no repeat indeterminates!"
             raise ValueError(value_error_msg)
+        return {Indeterminate(name): exponent for name, exponent in weights}
 
-        # Determine the monomial's weight vector.
-        self.weight_dict = {Indeterminate(elt[0]): np.int64(elt[1])
-                              for elt in monomial_fully_split_ones_added}
+    @classmethod
+    def _from_parts(cls,
+                    coefficient: float,
+                    weight_dict: dict[Indeterminate, int]) -> Self:
+        """Construct a Monomial directly from its coefficient and weights. Class method.
+
+        Should only be used internally; weight_dict must not contain zero exponents,
+        and must not be mutated afterwards.
+
+        Args:
+            coefficient (float): The coefficient.
+            weight_dict (dict[Indeterminate, int]): The weight vector.
+
+        Returns:
+            Self: The resulting Monomial.
+        """
+        monomial = cls.__new__(cls)
+        monomial.coefficient = coefficient
+        monomial.weight_dict = weight_dict
+        monomial._init_key() # noqa: SLF001
+        return monomial
+
+    # See https://stackoverflow.com/questions/2909106/whats-a-correct-and-good-way-to-implement-hash # noqa: E501
+    def _init_key(self) -> None:
+        """Compute the Monomial's key, hash and degree once, since it's immutable."""
+        self._key = (self.coefficient, tuple(sorted(self.weight_dict.items())))
+        self._hash = hash(self._key)
+        self._degree = sum(self.weight_dict.values())
+
+    def __reduce__(self) -> tuple:
+        """Pickle and copy by parts, so that the cached hash is recomputed.
+
+        String hashes differ between processes, so a pickled hash would be stale.
+        """
+        return (Monomial._from_parts, (self.coefficient, self.weight_dict))
 
     @classmethod
     def is_valid_monomial_regex(cls: Self, monomial: str) -> bool:
@@ -85,21 +267,33 @@ class Monomial:
         """
         return bool(cls.MONOMIAL_REGEX.match(monomial))
 
-    # See https://stackoverflow.com/questions/2909106/whats-a-correct-and-good-way-to-implement-hash # noqa: E501
-    def __key(self) -> tuple[np.float64, tuple[np.int64]]:
-        """Get a unique key of a Monomial instance."""
-        return (self.coefficient,
-                tuple(sorted(self.weight_dict.items())))
-
     def __eq__(self, other: object) -> bool:
         """To test equality of two monomials."""
         if not isinstance(other, Monomial):
             return NotImplemented
-        return self.__key() == other.__key()
+        return self._key == other._key
+
+    def __lt__(self, other: object) -> bool:
+        """Compare two monomials in grevlex order.
+
+        Compare total degree first. On a tie, walk both sorted weight vectors from
+        the last indeterminate down: at the first pair that differs, the monomial
+        with the later indeterminate, or the larger exponent of the same one, is
+        the smaller.
+        """
+        if not isinstance(other, Monomial):
+            return NotImplemented
+        if self._degree != other._degree:
+            return self._degree < other._degree
+
+        self_weights, other_weights = self._key[1], other._key[1]
+        if self_weights != other_weights:
+            return other_weights[::-1] < self_weights[::-1]
+        return self.coefficient < other.coefficient
 
     def __hash__(self) -> int:
         """To use this class in a set, need to be able to compute a hash."""
-        return hash((self.coefficient, tuple(sorted(self.weight_dict.items()))))
+        return self._hash
 
     def __repr__(self) -> str:
         """Produce a string representation of the object.
@@ -108,15 +302,15 @@ class Monomial:
         omits the coefficient, depending on whether the Monomial has any
         indeterminates. If an exponent is 1, it omits the exponent.
         """
-        if np.float64(self.coefficient) == np.float64(1):
+        if self.coefficient == 1.:
             if not self.weight_dict:
                 return "1.0"
             monomial_string_list = []
         else:
-            monomial_string_list = [str(np.float64(self.coefficient))]
+            monomial_string_list = [str(self.coefficient)]
 
         for indeterminate, exponent in self.weight_dict.items():
-            if np.float64(exponent) == np.float64(1):
+            if exponent == 1:
                 monomial_string_list.append(indeterminate.name)
             else:
                 monomial_string_list.append(f"{indeterminate.name}^{exponent}")
@@ -128,22 +322,19 @@ class Monomial:
         if not isinstance(other, Monomial):
             return NotImplemented
 
-        new_monomial = Monomial("0")
-        new_monomial.coefficient = self.coefficient * other.coefficient
-        for key in self.weight_dict:
-            new_monomial.weight_dict[key] = self.weight_dict[key]
+        coefficient = self.coefficient * other.coefficient
+        if coefficient == 0:
+            return Monomial._from_parts(coefficient, {})
 
-        for key in other.weight_dict:
-            if key in new_monomial.weight_dict:
-                new_monomial.weight_dict[key] += other.weight_dict[key]
-            else:
-                new_monomial.weight_dict[key] = other.weight_dict[key]
+        weight_dict = dict(self.weight_dict)
+        for key, exponent in other.weight_dict.items():
+            weight_dict[key] = weight_dict.get(key, 0) + exponent
 
-        if set(new_monomial.weight_dict.values()) == {0} \
-        or new_monomial.coefficient == 0:
-            return Monomial(str(new_monomial.coefficient))
+        return Monomial._from_parts(coefficient, weight_dict)
 
-        return new_monomial
+    def __neg__(self) -> Self:
+        """Negate a Monomial, returning a new one."""
+        return Monomial._from_parts(-self.coefficient, dict(self.weight_dict))
 
     def derivative(self, wrt: str | Indeterminate) -> Self:
         """Take the derivative of the monomial with respect to an indeterminate.
@@ -162,21 +353,25 @@ class Monomial:
         if wrt not in set(self.weight_dict.keys()):
             return Monomial("0")
 
+        # Build a new weight_dict, rather than decrementing this Monomial's own.
         exponent = self.weight_dict[wrt]
-        new_monomial = Monomial("0")
-        new_monomial.coefficient = self.coefficient * exponent
-        new_monomial.weight_dict = self.weight_dict
-        new_monomial.weight_dict[wrt] -= 1
-        if new_monomial.weight_dict[wrt] == 0:
-            del new_monomial.weight_dict[wrt]
+        weight_dict = {ind: e - 1 if ind == wrt else e
+                       for ind, e in self.weight_dict.items()
+                       if ind != wrt or e > 1}
 
-        return new_monomial
+        return Monomial._from_parts(self.coefficient * exponent, weight_dict)
 
 
 class Polynomial:
     """A polynomial.
 
     Like f(x, y) = x^2 + 3xy - 2, writen as 'x^2 + 3*x*y - 2'.
+
+    Internally, the polynomial is stored as a structure of arrays: an exponent matrix
+    of shape (n_monomials, n_indeterminates), whose columns are given by a shared
+    indeterminate index, together with a vector of coefficients. The rows are kept
+    consolidated (no repeat weight vectors) and in descending grevlex order, with
+    the indeterminates ordered by name.
     """
 
     # TODO(Nicholas): write docstring,
@@ -186,8 +381,15 @@ class Polynomial:
         # able to handle matrices instead of determinates.
         # 001
 
-    indeterminates: set[Indeterminate]
-    monomials: set[Monomial]
+    # The order the rows of the exponent matrix are kept in.
+    _order: MonomialOrder = "grevlex"
+
+    __slots__ = ("_coefficients", "_exponents", "_hash", "_var_index")
+
+    _var_index: dict[Indeterminate, int]
+    _exponents: np.ndarray
+    _coefficients: np.ndarray
+    _hash: int
 
     def __init__(self, poly: str | set[Monomial]) -> None:
         """Initialize an instance of the Polynomial class.
@@ -201,133 +403,311 @@ class Polynomial:
             poly (str): The polynomial desired, written like 'f(x,y) = x^2 + 3*x*y - 2.'
         """
         if isinstance(poly, str):
-            poly_split_by_spaces = poly.split(" ")
-            self.monomials = set()
-
-            # Test whether input string is valid.
-            for i in range(len(poly_split_by_spaces)):
-                token = poly_split_by_spaces[i]
-                # Test whether all tokens are "+", "-", or a valid monomial.
-                if token not in {"+", "-"} \
-                and not Monomial.is_valid_monomial_regex(token):
-                    value_error_msg = f"Invalid input: token '{token}'!"
-                    raise ValueError(value_error_msg)
-                # Test that "+"/"-" and Monomial instances alternate.
-                if i < len(poly_split_by_spaces)-1:
-                    token_1 = poly_split_by_spaces[i+1]
-                    if (token in {"+", "-"} and token_1 in {"+", "-"}) \
-                    or (Monomial.is_valid_monomial_regex(token) and \
-                    Monomial.is_valid_monomial_regex(token_1)):
-                        value_error_msg = f"Invalid sequential tokens: {token}, {token_1}!" # noqa: E501
-                        raise ValueError(value_error_msg)
-
-            # Create list of monomials.
-            monomial_list = []
+            # Walk the space-separated tokens once. Each is "+", "-", or a valid
+            # monomial, which is parsed as it's validated; signs and monomials must
+            # alternate.
+            scanned_monomials = []
             negate_next_monomial = False
-            while len(poly_split_by_spaces) > 0:
-                current_token = poly_split_by_spaces.pop(0)
-                if current_token == "+":
-                    negate_next_monomial = False
-                    continue
-                if current_token == "-":
-                    negate_next_monomial = True
-                elif Monomial.is_valid_monomial_regex(current_token):
-                    current_monomial = Monomial(monomial=current_token)
-                    if negate_next_monomial:
-                        current_monomial.coefficient *= -1.
-                    monomial_list.append(current_monomial)
-                    negate_next_monomial = False
-                else:
-                    value_error_msg = "Code issue: all cases should have been checked."
+            previous_token, previous_is_sign = None, None
+            for token in poly.split(" "):
+                is_sign = token in {"+", "-"}
+                if not is_sign:
+                    scanned = Monomial._scan_monomial_string(token) # noqa: SLF001
+                    if scanned is None:
+                        value_error_msg = f"Invalid input: token '{token}'!"
+                        raise ValueError(value_error_msg)
+                if previous_is_sign is is_sign:
+                    value_error_msg = f"Invalid sequential tokens: {previous_token}, {token}!" # noqa: E501
                     raise ValueError(value_error_msg)
+                if is_sign:
+                    negate_next_monomial = token == "-"
+                else:
+                    scanned_monomials.append((negate_next_monomial, scanned))
+                    negate_next_monomial = False
+                previous_token, previous_is_sign = token, is_sign
+
+            # Create list of monomials, without parsing their strings again.
+            monomial_list = [
+                Monomial._from_parts( # noqa: SLF001
+                    -coefficient if negate_monomial else coefficient,
+                    Monomial._weight_dict(weights)) # noqa: SLF001
+                for negate_monomial, (coefficient, weights) in scanned_monomials]
 
             # Check that no monomials repeat, even up to scalar.
             # We choose to prohibit this.
             # TODO(Nicholas): See whether we should allow this and
             # just use consolidation method below.
             # 002
-            for i in range(len(monomial_list)):
-                for j in range(i+1, len(monomial_list)):
-                    m1, m2 = monomial_list[i], monomial_list[j]
-                    if m1.weight_dict == m2.weight_dict:
-                        value_error_msg = f"Invalid input: repeated monomials {m1}, {m2}!" # noqa: E501
-                        raise ValueError(value_error_msg)
-
-            # Now that we know there are no repeats, convert monomial list to set.
-            self.monomials = set(monomial_list)
+            # Key each monomial by its weight vector, so this is a single pass.
+            seen_monomials = {}
+            for m2 in monomial_list:
+                weight_key = frozenset(m2.weight_dict.items())
+                m1 = seen_monomials.setdefault(weight_key, m2)
+                if m1 is not m2:
+                    value_error_msg = f"Invalid input: repeated monomials {m1}, {m2}!"
+                    raise ValueError(value_error_msg)
 
         # Should only be used internally.
         elif isinstance(poly, set) and all(isinstance(m, Monomial) for m in poly):
-            self.monomials = poly
+            monomial_list = list(poly)
 
-        # In both cases, remove all monomials with coefficient 0.
-        self.monomials = {m for m in list(self.monomials) if m.coefficient != 0}
+        else:
+            type_error_msg = "Polynomial must be given a string or set of Monomials."
+            raise TypeError(type_error_msg)
+
+        # Build the shared indeterminate index, with columns in sorted order.
+        var_index = {indeterminate: i for i, indeterminate in enumerate(
+            sorted({ind for m in monomial_list for ind in m.weight_dict}))}
+
+        # Pack the monomials into an exponent matrix and a coefficient vector.
+        exponents = np.zeros((len(monomial_list), len(var_index)), dtype=np.int64)
+        for row, m in enumerate(monomial_list):
+            for indeterminate, exponent in m.weight_dict.items():
+                if exponent > MAX_EXPONENT:
+                    value_error_msg = f"Invalid input: exponent {exponent} is too large!" # noqa: E501
+                    raise ValueError(value_error_msg)
+                exponents[row, var_index[indeterminate]] = exponent
+        coefficients = np.array([m.coefficient for m in monomial_list],
+                                dtype=np.float64)
+
+        self._init_soa(var_index, exponents, coefficients)
+
+    @classmethod
+    def _from_soa(cls,
+                  var_index: dict[Indeterminate, int],
+                  exponents: np.ndarray,
+                  coefficients: np.ndarray,
+                  *,
+                  presorted: bool = False) -> Self:
+        """Construct a Polynomial directly from an exponent matrix. Class method.
+
+        Should only be used internally. The exponent matrix may contain repeat rows
+        and zero coefficients; these are handled the same way as in __init__. The
+        result may share var_index, which must not be mutated afterwards.
+
+        Args:
+            var_index (dict[Indeterminate, int]): Maps each indeterminate to its
+                column of the exponent matrix.
+            exponents (np.ndarray): Exponent matrix, shape (n_monomials, n_vars).
+            coefficients (np.ndarray): Coefficient vector, shape (n_monomials,).
+            presorted (bool): Whether the rows are a few runs, each already in
+                descending grevlex order, as when stacking canonical matrices.
+
+        Returns:
+            Self: The resulting Polynomial.
+        """
+        polynomial = cls.__new__(cls)
+        polynomial._init_soa(var_index, exponents, coefficients, # noqa: SLF001
+                             presorted=presorted)
+        return polynomial
+
+    def _init_soa(self,
+                  var_index: dict[Indeterminate, int],
+                  exponents: np.ndarray,
+                  coefficients: np.ndarray,
+                  *,
+                  presorted: bool = False) -> None:
+        """Consolidate and store the given exponent matrix and coefficient vector."""
+        exponents, coefficients = Polynomial._consolidate_exponents(
+            exponents, coefficients, presorted=presorted)
+
+        # Remove all monomials with coefficient 0.
+        nonzero_mask = coefficients != 0
+        if not nonzero_mask.all():
+            exponents = exponents[nonzero_mask]
+            coefficients = coefficients[nonzero_mask]
+
+        # Drop the indeterminates which no longer show up in any monomial. Usually
+        # they all still do, and the given index can be kept as is.
+        used_mask = exponents.any(axis=0)
+        if not used_mask.all():
+            var_index = {ind: i for i, ind in enumerate(
+                ind for ind, used in zip(var_index, used_mask, strict=True) if used)}
+            exponents = exponents[:, used_mask]
 
         # If polynomial is empty, make it the zero polynomial.
-        if not self.monomials:
-            self.monomials = {Monomial("0")}
+        if coefficients.size == 0:
+            exponents = np.zeros((1, 0), dtype=np.int64)
+            coefficients = np.zeros(1, dtype=np.float64)
+
+        self._var_index = var_index
+        self._exponents = exponents
+        self._coefficients = coefficients
+
+        # Polynomials are immutable, and their arrays canonical, so hash them once.
+        # Zero coefficients were dropped above, so there are no -0.0s to worry about.
+        self._hash = hash((tuple(self._var_index),
+                           exponents.tobytes(),
+                           coefficients.tobytes()))
+
+    @property
+    def indeterminates(self) -> set[Indeterminate]:
+        """The polynomial's indeterminates, i.e. the columns of the exponent matrix."""
+        return set(self._var_index)
+
+    @property
+    def monomials(self) -> set[Monomial]:
+        """The polynomial's monomials, materialized from the exponent matrix."""
+        return set(self._monomial_list())
+
+    def _monomial_list(self) -> list[Monomial]:
+        """Materialize the rows of the exponent matrix as Monomials, in order."""
+        indeterminates = list(self._var_index)
+        monomial_list = []
+        for exponent_row, coefficient in zip(self._exponents.tolist(),
+                                             self._coefficients.tolist(),
+                                             strict=True):
+            weight_dict = {indeterminates[i]: exponent
+                           for i, exponent in enumerate(exponent_row) if exponent}
+            monomial_list.append(Monomial._from_parts(coefficient, weight_dict)) # noqa: SLF001
+        return monomial_list
+
+    def _aligned_exponents(self, other: Self) -> tuple[dict[Indeterminate, int],
+                                                      np.ndarray,
+                                                      np.ndarray]:
+        """Express both polynomials' exponent matrices over a common var index.
+
+        Args:
+            other (Self): The other polynomial.
+
+        Returns:
+            tuple[dict[Indeterminate, int], np.ndarray, np.ndarray]: The common
+                indeterminate index and the two re-indexed exponent matrices.
+        """
+        var_index = {indeterminate: i for i, indeterminate in enumerate(
+            sorted(self._var_index.keys() | other._var_index.keys()))} # noqa: SLF001
+
+        return (var_index,
+                self._reindexed_exponents(var_index),
+                other._reindexed_exponents(var_index)) # noqa: SLF001
+
+    def _reindexed_exponents(self, var_index: dict[Indeterminate, int]) -> np.ndarray:
+        """Express the exponent matrix over a larger indeterminate index."""
+        exponents = np.zeros((self._exponents.shape[0], len(var_index)),
+                             dtype=np.int64)
+        exponents[:, [var_index[ind] for ind in self._var_index]] = self._exponents
+        return exponents
+
+    def leading_monomial(self, order: MonomialOrder = "grevlex") -> Monomial:
+        """Get the leading monomial in the given order, with coefficient 1.
+
+        Args:
+            order (MonomialOrder): The monomial order, "lex", "grlex" or "grevlex".
+
+        Returns:
+            Monomial: The leading monomial, with coefficient 1.
+        """
+        return Monomial._from_parts(1., self.leading_term(order).weight_dict) # noqa: SLF001
 
-        # Create easily accessible list of the polynomial's indeterminates.
-        self.indeterminates = set()
-        for monomial in self.monomials:
-            self.indeterminates.update(monomial.weight_dict.keys())
+    def leading_coefficient(self, order: MonomialOrder = "grevlex") -> float:
+        """Get the coefficient of the leading monomial in the given order.
+
+        Args:
+            order (MonomialOrder): The monomial order, "lex", "grlex" or "grevlex".
+
+        Returns:
+            float: The leading coefficient.
+        """
+        return float(self._coefficients[self._leading_row(order)])
+
+    def leading_term(self, order: MonomialOrder = "grevlex") -> Monomial:
+        """Get the leading term in the given order, i.e. the monomial with coefficient.
+
+        Args:
+            order (MonomialOrder): The monomial order, "lex", "grlex" or "grevlex".
+
+        Returns:
+            Monomial: The leading term.
+        """
+        row = self._leading_row(order)
+        indeterminates = list(self._var_index)
+        weight_dict = {indeterminates[i]: exponent
+                       for i, exponent in enumerate(self._exponents[row].tolist())
+                       if exponent}
+        return Monomial._from_parts(float(self._coefficients[row]), weight_dict) # noqa: SLF001
+
+    def _leading_row(self, order: MonomialOrder) -> int:
+        """Find the row of the leading monomial, which is the first in grevlex.
+
+        Raises:
+            ValueError: If the polynomial is zero, which has no leading monomial.
+        """
+        if self._coefficients[0] == 0:
+            value_error_msg = "The zero polynomial has no leading monomial!"
+            raise ValueError(value_error_msg)
+        if order == self._order:
+            return 0
+        return int(Polynomial._row_order(self._exponents, order)[0])
+
+    def __reduce__(self) -> tuple:
+        """Pickle and copy by arrays, so that the cached hash is recomputed.
+
+        String hashes differ between processes, so a pickled hash would be stale.
+        """
+        return (Polynomial._from_soa,
+                (self._var_index, self._exponents, self._coefficients))
 
     def __eq__(self, other: object) -> bool:
         """Test equality of two polynomials.
 
-        Two polynomials are equal iff their monomial sets are equal.
+        Two polynomials are equal iff their monomial sets are equal. Since the
+        exponent matrices are kept in canonical form, it suffices to compare arrays.
         """
         if not isinstance(other, Polynomial):
             return NotImplemented
 
-        return self.monomials == other.monomials
+        return self._var_index == other._var_index \
+            and np.array_equal(self._exponents, other._exponents) \
+            and np.array_equal(self._coefficients, other._coefficients)
 
     def __hash__(self) -> int:
         """To use this class in a set, need to be able to compute a hash."""
-        return hash((self.indeterminates, self.monomials))
+        return self._hash
 
     def __repr__(self) -> str:
         """Produce a string representation of the object.
 
         Details: Simply prints the sum of all monomials of the polynomial.
         """
-        return " + ".join([m.__repr__() for m in self.monomials])
+        return " + ".join([m.__repr__() for m in self._monomial_list()])
 
     def __add__(self, other: object) -> Self:
         """Add two polynomials, regardless of their indeterminates."""
         if not isinstance(other, Polynomial):
             return NotImplemented
 
-        # Get the polynomials' sets of monomials as lists and concatenate.
-        all_monomials = list(self.monomials) + list(other.monomials)
-
-        # For each monomial pair, if underlying weight_dicts are equal, add their
-        # coefs and remove the second monomial from consideration.
-        final_monomial_set = Polynomial._consolidate_monomial_list(all_monomials)
+        # Stack the polynomials' exponent matrices over a common indeterminate index;
+        # rows with equal weight vectors are merged on construction. Re-indexing
+        # keeps each matrix in grevlex order, so this is a merge of two sorted runs.
+        var_index, self_exponents, other_exponents = self._aligned_exponents(other)
+        exponents = np.vstack([self_exponents, other_exponents])
+        coefficients = np.concatenate([self._coefficients, other._coefficients])
 
-        return Polynomial(final_monomial_set)
+        return Polynomial._from_soa(var_index, exponents, coefficients, presorted=True)
 
     def __sub__(self, other: object) -> Self:
         """Subtract two polynomials."""
         if not isinstance(other, Polynomial):
             return NotImplemented
 
-        # Negate the other polynomial.
-        for m in other.monomials:
-            m.coefficient *= -1
+        # Stack the exponent matrices as in __add__, negating the other polynomial's
+        # coefficients on the way in. Neither polynomial is mutated.
+        var_index, self_exponents, other_exponents = self._aligned_exponents(other)
+        exponents = np.vstack([self_exponents, other_exponents])
+        coefficients = np.concatenate([self._coefficients, -other._coefficients])
 
-        return self + other
+        return Polynomial._from_soa(var_index, exponents, coefficients, presorted=True)
 
     def __mul__(self, other: object) -> Self:
         """Multiply two polynomials."""
         if not isinstance(other, Polynomial):
             return NotImplemented
 
-        new_monomial_list = [m1*m2 for m1 in self.monomials for m2 in other.monomials]
+        var_index, self_exponents, other_exponents = self._aligned_exponents(other)
 
-        final_monomial_set = Polynomial._consolidate_monomial_list(new_monomial_list)
-
-        return Polynomial(final_monomial_set)
+        exponents, coefficients = poly_mul(self_exponents, self._coefficients,
+                                           other_exponents, other._coefficients)
+        return Polynomial._from_soa(var_index, exponents, coefficients)
 
     def __rmul__(self, other: object) -> Self:
         """Handle left scalar multiplication."""
@@ -336,6 +716,60 @@ class Polynomial:
 
         return Polynomial(str(other)) * self
 
+    def __call__(self, /, **values: float | np.ndarray) -> float | np.ndarray:
+        """Evaluate the polynomial, given a value for each of its indeterminates.
+
+        Example:
+        >> Polynomial("x^2 + 3*x*y - 2")(x=1, y=np.array([0, 1, 2]))
+        array([-1.,  2.,  5.])
+
+        Values may be arrays, which are broadcast against each other, to evaluate
+        at many points at once. Every monomial is evaluated at every point at once,
+        which takes memory proportional to n_points * n_monomials * n_indeterminates.
+        Univariate polynomials with few gaps between their degrees are instead
+        evaluated by Horner's scheme, via np.polynomial.polynomial.polyval, which
+        takes one vectorized step per degree.
+
+        Args:
+            **values (float | np.ndarray): The value of each indeterminate, by name.
+                Values for indeterminates not in the polynomial are ignored, except
+                that they still broadcast against the others.
+
+        Raises:
+            ValueError: If an indeterminate of the polynomial isn't given a value.
+
+        Returns:
+            float | np.ndarray: The value of the polynomial, broadcast to the shape
+                of all the given values.
+        """
+        points = []
+        for indeterminate in self._var_index:
+            if indeterminate.name not in values:
+                value_error_msg = f"Missing value for indeterminate '{indeterminate.name}'!" # noqa: E501
+                raise ValueError(value_error_msg)
+            points.append(np.asarray(values[indeterminate.name], dtype=np.float64))
+        shape = np.broadcast_shapes(*(np.shape(value) for value in values.values()))
+
+        if not points:
+            return self._coefficients[0] + np.zeros(shape)
+
+        # The rows are in descending order, so the first has the highest degree.
+        n_monomials, max_degree = self._exponents.shape[0], self._exponents[0, 0]
+        if len(points) == 1 and max_degree < 2*n_monomials:
+            # Coefficients by degree, lowest first.
+            dense_coefficients = np.zeros(max_degree + 1)
+            dense_coefficients[self._exponents[:, 0]] = self._coefficients
+            return np.polynomial.polynomial.polyval(np.broadcast_to(points[0], shape),
+                                                    dense_coefficients)
+
+        # Raise each point to every exponent row, and multiply across each row to get
+        # the value of each monomial: shape (*shape, n_monomials).
+        stacked_points = np.stack([np.broadcast_to(point, shape) for point in points],
+                                  axis=-1)
+        monomial_values = np.prod(
+            stacked_points[..., np.newaxis, :] ** self._exponents, axis=-1)
+        return monomial_values @ self._coefficients
+
     def derivative(self, wrt: str | Indeterminate) -> Self:
         """Take the derivative of the polynomial with respect to an indeterminate.
 
@@ -349,40 +783,160 @@ class Polynomial:
             wrt = Indeterminate(wrt)
 
         # If wrt doesn't show up in the polynomial's indeterminate list, simply return 0
-        if wrt not in self.indeterminates:
+        if wrt not in self._var_index:
             return Polynomial("0")
 
-        new_monomial_set = set()
+        # Multiply each coefficient by its exponent of wrt and decrement that
+        # exponent, for all monomials at once. Monomials without wrt get coefficient 0
+        # and are dropped, so no exponent goes negative.
+        wrt_column = self._var_index[wrt]
+        coefficients = self._coefficients * self._exponents[:, wrt_column]
+        exponents = self._exponents.copy()
+        exponents[:, wrt_column] -= 1
+        nonzero_mask = coefficients != 0
+
+        # Dividing every row by wrt keeps them in grevlex order.
+        return Polynomial._from_soa(self._var_index,
+                                    exponents[nonzero_mask],
+                                    coefficients[nonzero_mask],
+                                    presorted=True)
 
-        for m in self.monomials:
-            m_prime = m.derivative(wrt=wrt)
-            if m_prime != Monomial("0"):
-                new_monomial_set.add(m_prime)
+    @classmethod
+    def _consolidate_exponents(cls,
+                               exponents: np.ndarray,
+                               coefficients: np.ndarray,
+                               *,
+                               presorted: bool = False) -> tuple[np.ndarray,
+                                                                  np.ndarray]:
+        """Add monomials with equal weight vectors. Class method.
+
+        Sorting the rows groups equal weight vectors together, so this takes
+        O(n log n) time rather than comparing every pair of monomials. When the rows
+        pack into grevlex keys, they are sorted as plain integers, which also puts
+        them in order; only wider matrices sort row by row and then reorder. If the
+        rows are presorted runs, the keys are sorted with timsort, which merges the
+        runs in linear time.
 
-        return Polynomial(new_monomial_set)
+        Args:
+            exponents (np.ndarray): Exponent matrix, possibly with repeat rows.
+            coefficients (np.ndarray): The corresponding coefficient vector.
+            presorted (bool): Whether the rows are a few runs, each already in
+                descending grevlex order.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Exponent matrix with no repeat rows, in
+                descending grevlex order, and the summed coefficient vector.
+        """
+        keys = cls._grevlex_keys(exponents)
+        if keys is not None:
+            if keys.size == 0:
+                return exponents.astype(np.int64, copy=False), coefficients
+
+            # Sort the keys into descending order, then sum each run of equal keys.
+            order = np.argsort(keys, kind="stable" if presorted else "quicksort")
+            order = order[::-1]
+            sorted_keys = keys[order]
+            starts = np.flatnonzero(np.concatenate(
+                [[True], sorted_keys[1:] != sorted_keys[:-1]]))
+            return (exponents[order[starts]].astype(np.int64, copy=False),
+                    np.add.reduceat(coefficients[order], starts))
+
+        unique_exponents, inverse = np.unique(exponents, axis=0, return_inverse=True)
+        unique_coefficients = np.bincount(inverse.reshape(-1),
+                                          weights=coefficients,
+                                          minlength=unique_exponents.shape[0])
+
+        order = cls._grevlex_order(unique_exponents)
+        return (unique_exponents[order].astype(np.int64, copy=False),
+                unique_coefficients[order])
 
     @classmethod
-    def _consolidate_monomial_list(cls, monomial_list: list[Monomial]) -> set[Monomial]:
-        """Add monomials with equal weight vectors. Class method.
+    def _row_order(cls, exponents: np.ndarray, order: MonomialOrder) -> np.ndarray:
+        """Sort the rows of an exponent matrix into descending order. Class method.
+
+        Lexicographic order compares the exponents column by column; graded
+        lexicographic order compares total degree first, then does the same.
+
+        Args:
+            exponents (np.ndarray): Exponent matrix.
+            order (MonomialOrder): The monomial order, "lex", "grlex" or "grevlex".
+
+        Raises:
+            ValueError: If the order isn't supported.
+
+        Returns:
+            np.ndarray: The permutation of the rows, as from np.argsort.
+        """
+        if order == "grevlex":
+            return cls._grevlex_order(exponents)
+        if order not in {"lex", "grlex"}:
+            value_error_msg = f"Invalid monomial order '{order}'!"
+            raise ValueError(value_error_msg)
+
+        # With no columns there are no keys, which np.lexsort rejects; a single row,
+        # like a nonzero constant's, is already in order anyway.
+        if exponents.shape[0] <= 1 or exponents.shape[1] == 0:
+            return np.arange(exponents.shape[0])
+
+        # np.lexsort sorts by its last key first, so list the columns last to first,
+        # negated to sort in descending order.
+        sort_keys = -exponents.T[::-1].astype(np.int64)
+        if order == "grlex":
+            total_degree = exponents.sum(axis=1, dtype=np.int64)
+            sort_keys = np.vstack([sort_keys, -total_degree])
+        return np.lexsort(sort_keys)
+
+    @classmethod
+    def _grevlex_order(cls, exponents: np.ndarray) -> np.ndarray:
+        """Sort the rows of an exponent matrix into descending grevlex order.
+
+        Graded reverse lexicographic order compares total degree first; ties go to
+        the monomial with the smaller exponent in the last indeterminate in which
+        they differ. Columns are taken in order, so the first is the largest.
+
+        Args:
+            exponents (np.ndarray): Exponent matrix.
+
+        Returns:
+            np.ndarray: The permutation of the rows, as from np.argsort.
+        """
+        # np.lexsort sorts by its last key first: descending degree, then ascending
+        # exponent of the last indeterminate, then the one before it, and so on.
+        total_degree = exponents.sum(axis=1, dtype=np.int64)
+        return np.lexsort(np.vstack([exponents.T, -total_degree]))
+
+    @classmethod
+    def _grevlex_keys(cls, exponents: np.ndarray) -> np.ndarray | None:
+        """Pack each row of an exponent matrix into a uint64 grevlex key. Class method.
+
+        The total degree goes in the top byte, followed by 255 - e for the exponent
+        e of each column from the last down to the second, so that comparing keys
+        as integers compares the rows in grevlex order. Equal keys mean equal rows,
+        since the first column's exponent is the degree minus the others.
 
         Args:
-            monomial_list (list[Monomial]): List of monomials, possibly with repeat
-                                            weight vectors.
+            exponents (np.ndarray): Exponent matrix.
 
         Returns:
-            set[Monomial]: List of monomials with no repeat weight vectors.
+            np.ndarray | None: The keys, or None if the matrix has more than
+                GREVLEX_KEY_MAX_VARS columns or a row of degree over
+                GREVLEX_KEY_MAX_DEGREE.
         """
-        final_monomial_set = set()
-        monomial_covered_mask = [False]*len(monomial_list)
-
-        for i in range(len(monomial_list)):
-            if not monomial_covered_mask[i]:
-                m1 = monomial_list[i]
-                for j in range(i+1, len(monomial_list)):
-                    m2 = monomial_list[j]
-                    if m1.weight_dict == m2.weight_dict:
-                        monomial_covered_mask[j] = True
-                        monomial_list[i].coefficient += m2.coefficient
-                final_monomial_set.add(m1)
-
-        return final_monomial_set
+        n_vars = exponents.shape[1]
+        if n_vars > GREVLEX_KEY_MAX_VARS \
+        or exponents.max(initial=0) > GREVLEX_KEY_MAX_DEGREE:
+            return None
+        # Row sums of a narrow matrix are much faster as a matrix product.
+        wide_exponents = exponents.astype(np.uint64)
+        total_degree = wide_exponents @ np.ones(n_vars, dtype=np.uint64)
+        if total_degree.max(initial=0) > GREVLEX_KEY_MAX_DEGREE:
+            return None
+
+        # The column's lane is (255 - e) << shift, so together the lanes are the sum
+        # of 255 << shift, minus exponents @ (1 << shift).
+        lane_weights = np.zeros(n_vars, dtype=np.uint64)
+        for lane, col in enumerate(range(n_vars - 1, 0, -1)):
+            lane_weights[col] = 1 << (48 - 8*lane)
+        lanes = GREVLEX_KEY_MAX_DEGREE * lane_weights.sum() \
+            - wide_exponents @ lane_weights
+        return (total_degree << np.uint64(56)) + lanes
@@ -0,0 +1,29 @@
+"""Tests for the pure NumPy stand-ins for the compiled kernels."""
+
+import pytest
+
+from symboliccomputation import _fallback
+from symboliccomputation.polynomial import Polynomial
+
+########################################################################################
+# Multiplication
+########################################################################################
+
+
+@pytest.mark.parametrize(argnames=("polynomial_1", "polynomial_2", "n_products"),
+                         argvalues=[
+    (Polynomial("0"), Polynomial("2"), 1),
+    (Polynomial("x + y"), Polynomial("x - y"), 4),
+    (Polynomial("x^200 + y"), Polynomial("x^100 - y^3 + 1"), 6),
+])
+def test_poly_mul_fallback(polynomial_1: list[Polynomial],
+                           polynomial_2: list[Polynomial],
+                           n_products: list[int]) -> None:
+    """Tests that the fallback forms every product, and they sum to the product."""
+    var_index, exp_a, exp_b = polynomial_1._aligned_exponents(polynomial_2)
+    out_exp, out_coef = _fallback.poly_mul(exp_a, polynomial_1._coefficients,
+                                           exp_b, polynomial_2._coefficients)
+
+    assert out_exp.shape == (n_products, len(var_index))
+    assert Polynomial._from_soa(var_index, out_exp, out_coef) \
+        == polynomial_1 * polynomial_2
@@ -0,0 +1,49 @@
+"""Tests for the indeterminate submodule."""
+
+import copy
+import pickle
+
+import pytest
+
+from symboliccomputation.indeterminate import Indeterminate
+
+########################################################################################
+# Indeterminates
+########################################################################################
+
+
+@pytest.mark.parametrize(argnames="name", argvalues=["x", "y", "asdf", "wow"])
+def test_indeterminate_interned(name: list[str]) -> None:
+    """Tests that indeterminates with the same name are the same object."""
+    indeterminate = Indeterminate(name)
+    assert Indeterminate(name) is indeterminate
+    assert copy.deepcopy(indeterminate) is indeterminate
+    assert pickle.loads(pickle.dumps(indeterminate)) is indeterminate  # noqa: S301
+
+
+def test_indeterminate_default_and_order() -> None:
+    """Tests the default name and ordering by name."""
+    assert Indeterminate() is Indeterminate("x")
+    assert sorted([Indeterminate("y"), Indeterminate("asdf"), Indeterminate("x")]) \
+        == [Indeterminate("asdf"), Indeterminate("x"), Indeterminate("y")]
+
+
+def test_indeterminate_immutable() -> None:
+    """Tests that an indeterminate's name can't be changed."""
+    indeterminate = Indeterminate("x")
+    with pytest.raises(AttributeError):
+        indeterminate.name = "y"
+    assert not hasattr(indeterminate, "__dict__")
+
+
+@pytest.mark.parametrize(argnames="invalid_name", argvalues=["1", "12345x", "0y"])
+def test_invalid_indeterminate(invalid_name: list[str]) -> None:
+    """Tests that names starting with a digit are rejected."""
+    with pytest.raises(ValueError, match="must not start w/ digit"):
+        Indeterminate(invalid_name)
+
+
+def test_empty_indeterminate() -> None:
+    """Tests that the empty name is rejected."""
+    with pytest.raises(ValueError, match="must not be empty"):
+        Indeterminate("")
@@ -0,0 +1,98 @@
+"""Tests for the compiled polynomial kernels."""
+
+import numpy as np
+import pytest
+
+from symboliccomputation.polynomial import Polynomial
+
+_kernels = pytest.importorskip("symboliccomputation._kernels")
+
+########################################################################################
+# Multiplication
+########################################################################################
+
+
+MUL_KERNEL_CASES = [
+    (Polynomial("0"), Polynomial("2")),
+    (Polynomial("x + y"), Polynomial("x - y")),
+    (Polynomial("x + y"), Polynomial("x + y")),
+    (Polynomial("2*x^2 + x*y - 8"), Polynomial("3*x^3*y - 2*x^2 + 2.1*x*y")),
+    (Polynomial("a + b + c + d + e + f + g + h + i"), Polynomial("a*i - 1")),
+    (Polynomial("a^200 + b + c + d + e + f + g + h"), Polynomial("a^55*h - a")),
+    (Polynomial("x^200 + y"), Polynomial("x^100 - y^3")),
+    (Polynomial("x^3 + x*y*z + y^2 - z + 3"), Polynomial("x*z - y^2*z^2 + 2*x + 1")),
+]
+
+
+@pytest.mark.parametrize(argnames=("polynomial_1", "polynomial_2"),
+                         argvalues=MUL_KERNEL_CASES)
+def test_poly_mul_kernel(polynomial_1: list[Polynomial],
+                         polynomial_2: list[Polynomial]) -> None:
+    """Tests that the kernel's product consolidates to the broadcast product."""
+    var_index, exp_a, exp_b = polynomial_1._aligned_exponents(polynomial_2)
+    out_exp, out_coef = _kernels.poly_mul(exp_a, polynomial_1._coefficients,
+                                          exp_b, polynomial_2._coefficients)
+
+    exp_exp = (exp_a[:, np.newaxis, :] + exp_b[np.newaxis, :, :]).reshape(
+        exp_a.shape[0] * exp_b.shape[0], len(var_index))
+    exp_coef = np.outer(polynomial_1._coefficients,
+                        polynomial_2._coefficients).ravel()
+
+    assert Polynomial._from_soa(var_index, out_exp, out_coef) \
+        == Polynomial._from_soa(var_index, exp_exp, exp_coef)
+
+
+@pytest.mark.parametrize(argnames=("polynomial_1", "polynomial_2"),
+                         argvalues=MUL_KERNEL_CASES)
+def test_products_heap(polynomial_1: list[Polynomial],
+                       polynomial_2: list[Polynomial]) -> None:
+    """Tests that the heap merge gives the consolidated product, already sorted."""
+    var_index, exp_a, exp_b = polynomial_1._aligned_exponents(polynomial_2)
+    out_exp, out_coef = _kernels._products_heap(exp_a, polynomial_1._coefficients,
+                                                exp_b, polynomial_2._coefficients)
+
+    assert Polynomial._from_soa(var_index, out_exp, out_coef) \
+        == polynomial_1 * polynomial_2
+    assert np.unique(out_exp, axis=0).shape == out_exp.shape
+    assert Polynomial._grevlex_order(out_exp).tolist() == list(range(len(out_coef)))
+
+
+def test_products_heap_wide() -> None:
+    """Tests a product whose exponents are too large to pack."""
+    polynomial = Polynomial(" + ".join(f"x^{k}" for k in range(200, 250)))
+    _, exp_a, exp_b = polynomial._aligned_exponents(polynomial)
+
+    out_exp, out_coef = _kernels.poly_mul(exp_a, polynomial._coefficients,
+                                          exp_b, polynomial._coefficients)
+
+    # (x^200 + ... + x^249)^2 has the 99 terms x^k, 400 <= k <= 498, with
+    # coefficient min(k-399, 499-k), and the heap emits them from the top down.
+    assert out_exp[:, 0].tolist() == list(range(498, 399, -1))
+    assert out_coef.tolist() == [min(k - 399, 499 - k) for k in range(498, 399, -1)]
+
+
+@pytest.mark.parametrize(argnames=("polynomial_1", "polynomial_2", "exp_exponents"),
+                         argvalues=[
+    (Polynomial("x^2147483000"), Polynomial("x^1000"), [[2147484000]]),
+    (Polynomial("x^2147483647 + y"), Polynomial("x^2147483647 + y"),
+     [[4294967294, 0], [2147483647, 1], [0, 2]]),
+])
+def test_poly_mul_kernel_large_exponents(polynomial_1: list[Polynomial],
+                                         polynomial_2: list[Polynomial],
+                                         exp_exponents: list[list[int]]) -> None:
+    """Tests that exponents near 2**31 don't wrap into the packed path."""
+    _, exp_a, exp_b = polynomial_1._aligned_exponents(polynomial_2)
+    out_exp, _ = _kernels.poly_mul(exp_a, polynomial_1._coefficients,
+                                   exp_b, polynomial_2._coefficients)
+    assert out_exp.tolist() == exp_exponents
+
+    # The maxima of narrower exponent matrices must not wrap either.
+    out_exp, _ = _kernels.poly_mul(exp_a.astype(np.int32), polynomial_1._coefficients,
+                                   exp_b.astype(np.int32), polynomial_2._coefficients)
+    assert out_exp.tolist() == exp_exponents
+
+
+def test_warmup() -> None:
+    """Tests that warming up the kernels leaves them working."""
+    _kernels.warmup()
+    assert Polynomial("x + 1") * Polynomial("x - 1") == Polynomial("x^2 - 1")
@@ -1,6 +1,8 @@
 """Tests for the polynomial submodule."""
 
+import pickle
 import re
+import time
 
 import numpy as np
 import pytest
@@ -41,6 +43,7 @@ def test_valid_monomial_regex(valid_monomial_regex: list[str]) -> None:
     "x^(1)",
     "x^-1",
     "x^0",
+    "",
 ])
 def test_invalid_monomial_regex(invalid_monomial_regex: list[str]) -> None:
     """Tests some invalid monomial regular expressions."""
@@ -56,6 +59,7 @@ def test_invalid_monomial_regex(invalid_monomial_regex: list[str]) -> None:
     "x^-1",
     "x^0",
     "-",
+    "",
 ])
 def test_invalid_monomials(invalid_monomial: list[str]) -> None:
     """Tests some invalid monomial regular expressions in the Monomial class itself."""
@@ -64,6 +68,16 @@ def test_invalid_monomials(invalid_monomial: list[str]) -> None:
     assert "Invalid monomial expression!" in str(exc_info.value)
 
 
+@pytest.mark.parametrize(argnames="leading_digit_monomial", argvalues=[
+    "12345x",
+    "2.5x^2*y",
+])
+def test_invalid_monomials_leading_digit(leading_digit_monomial: list[str]) -> None:
+    """Tests that a coefficient without an asterisk is read into the name."""
+    with pytest.raises(ValueError, match="must not start w/ digit"):
+        Monomial(leading_digit_monomial)
+
+
 @pytest.mark.parametrize(argnames="invalid_monomial_repeated_ind", argvalues=[
     "x*x",
     "1.0*xy*xy^2",
@@ -173,6 +187,50 @@ def test_monomial_derivative(monomial: list[Monomial],
     assert monomial.derivative(wrt) == result
 
 
+def test_monomial_derivative_leaves_monomial_unchanged() -> None:
+    """Tests that taking a derivative doesn't mutate the original Monomial."""
+    monomial = Monomial("4*x^2*y")
+    monomial_set = {monomial}
+    monomial.derivative("x")
+    assert monomial == Monomial("4*x^2*y")
+    assert Monomial("4*x^2*y") in monomial_set
+
+
+@pytest.mark.parametrize(argnames=("monomial", "result"), argvalues=[
+    (Monomial("0"), Monomial("0")),
+    (Monomial("x"), Monomial("-1*x")),
+    (Monomial("-5*x^3*y"), Monomial("5*x^3*y")),
+])
+def test_monomial_neg(monomial: list[Monomial], result: list[Monomial]) -> None:
+    """Tests some Monomial negations."""
+    assert -monomial == result
+
+
+def test_monomial_neg_weights_not_shared() -> None:
+    """Tests that a negated Monomial doesn't share weights with the original."""
+    monomial = Monomial("4*x^2*y")
+    negated = -monomial
+    assert negated.weight_dict is not monomial.weight_dict
+    negated.weight_dict[Indeterminate("z")] = 1
+    assert monomial.weight_dict == {Indeterminate("x"): 2, Indeterminate("y"): 1}
+
+
+@pytest.mark.parametrize(argnames=("smaller", "larger"), argvalues=[
+    (Monomial("1"), Monomial("x")),
+    (Monomial("x^5"), Monomial("x*y^2*z^3")),
+    (Monomial("y"), Monomial("x")),
+    (Monomial("z^2"), Monomial("x*y")),
+    (Monomial("x*z^2"), Monomial("y^3")),
+    (Monomial("x^2*z"), Monomial("x*y^2")),
+    (Monomial("-1*x*y"), Monomial("2*x*y")),
+])
+def test_monomial_grevlex(smaller: list[Monomial], larger: list[Monomial]) -> None:
+    """Tests some Monomial comparisons in grevlex order."""
+    assert smaller < larger
+    assert larger > smaller
+    assert not larger <= smaller
+
+
 ########################################################################################
 # Polynomials
 ########################################################################################
@@ -187,11 +245,20 @@ def test_monomial_derivative(monomial: list[Monomial],
     ("x^-1", "Invalid input: token 'x^-1'!"),
     ("x^0", "Invalid input: token 'x^0'!"),
     ("x ++ y", "Invalid input: token '++'!"),
+    ("", "Invalid input: token ''!"),
+    ("x + ", "Invalid input: token ''!"),
+    ("x - ", "Invalid input: token ''!"),
+    ("x  + y", "Invalid input: token ''!"),
+    ("x +  y", "Invalid input: token ''!"),
+    (" + -3", "Invalid input: token ''!"),
     ("x y", "Invalid sequential tokens: x, y!"),
+    ("x*x y", "Invalid sequential tokens: x*x, y!"),
+    ("x + y*x*y", "Invalid monomial expression: no repeat indeterminates!"),
     ("x + x", "Invalid input: repeated monomials x, x!"),
     ("x + 1.0*x", "Invalid input: repeated monomials x, x!"),
     ("x + y + x*y + x*y*z - 12345*x",
      "Invalid input: repeated monomials x, -12345.0*x!"),
+    ("x*y^2 + 3 - 2*y^2*x", "Invalid input: repeated monomials x*y^2, -2.0*x*y^2!"),
 ])
 def test_invalid_polynomials(invalid_polynomial: list[str],
                              exp_error_msg: list[str]) -> None:
@@ -240,6 +307,70 @@ def test_valid_polynomial(valid_polynomial: list[str],
     assert current_polynomial.monomials == exp_monomials
 
 
+@pytest.mark.parametrize(argnames=("polynomial", "exp_indeterminates"), argvalues=[
+    (Polynomial("x + y") - Polynomial("y"), {Indeterminate("x")}),
+    (Polynomial("x*y + z").derivative("z"), set()),
+    (Polynomial("x*y + z").derivative("x"), {Indeterminate("y")}),
+    (Polynomial("x") * Polynomial("y + 1"), {Indeterminate("x"), Indeterminate("y")}),
+])
+def test_polynomial_indeterminates(polynomial: list[Polynomial],
+                                   exp_indeterminates: set[Indeterminate]) -> None:
+    """Tests that results only keep the indeterminates that still show up."""
+    assert polynomial.indeterminates == exp_indeterminates
+    polynomial.indeterminates.add(Indeterminate("w"))
+    assert polynomial.indeterminates == exp_indeterminates
+
+
+def _long_polynomial_string(n_monomials: int) -> str:
+    """Write k*x^k for k = 1, ..., n_monomials, with alternating signs."""
+    polynomial_string = " ".join(f"{'+' if k % 2 else '-'} {k}*x^{k}"
+                                 for k in range(1, n_monomials + 1))
+    return polynomial_string.removeprefix("- ")
+
+
+def test_long_polynomial() -> None:
+    """Tests parsing a polynomial with many monomials, alternating signs."""
+    n_monomials = 5000
+    current_polynomial = Polynomial(_long_polynomial_string(n_monomials))
+
+    assert current_polynomial._exponents[:, 0].tolist() \
+        == list(range(n_monomials, 0, -1))
+    assert current_polynomial._coefficients.tolist() \
+        == [k if k % 2 or k == 1 else -k for k in range(n_monomials, 0, -1)]
+
+
+def test_long_polynomial_linear_time() -> None:
+    """Tests that parsing 4 times as many monomials takes well under 16 times as long.
+
+    A linear parse should take about 4 times as long, and a quadratic one 16 times.
+    The best of a few runs is used, to keep the test steady on a busy machine.
+    """
+    def parse_time(n_monomials: int) -> float:
+        polynomial_string = _long_polynomial_string(n_monomials)
+        times = []
+        for _ in range(5):
+            start = time.perf_counter()
+            Polynomial(polynomial_string)
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    assert parse_time(8000) < 10 * parse_time(2000)
+
+
+@pytest.mark.parametrize(argnames=("polynomial_1", "polynomial_2"), argvalues=[
+    (Polynomial("0"), Polynomial("x") - Polynomial("x")),
+    (Polynomial("x + y"), Polynomial("y + x")),
+    (Polynomial("2*x*y - 3"), Polynomial("x*y - 3") + Polynomial("y*x")),
+    (Polynomial("x^2 - 1"), Polynomial("x + 1") * Polynomial("x - 1")),
+])
+def test_polynomial_hash(polynomial_1: list[Polynomial],
+                         polynomial_2: list[Polynomial]) -> None:
+    """Tests that equal Polynomials hash equal, and can be used in sets and dicts."""
+    assert hash(polynomial_1) == hash(polynomial_2)
+    assert {polynomial_1, polynomial_2} == {polynomial_1}
+    assert {polynomial_1: "value"}[polynomial_2] == "value"
+
+
 @pytest.mark.parametrize(argnames=("polynomial_1",
                                    "polynomial_2",
                                    "exp_polynomial_sum"),
@@ -283,6 +414,14 @@ def test_polynomial_diff(polynomial_1: list[str],
     assert Polynomial(polynomial_1) - Polynomial(polynomial_2) == exp_polynomial_diff
 
 
+def test_polynomial_diff_leaves_operands_unchanged() -> None:
+    """Tests that subtracting doesn't mutate either polynomial."""
+    polynomial_1, polynomial_2 = Polynomial("x + y"), Polynomial("x - 2*y")
+    polynomial_1 - polynomial_2
+    assert polynomial_1 == Polynomial("x + y")
+    assert polynomial_2 == Polynomial("x - 2*y")
+
+
 @pytest.mark.parametrize(argnames=("polynomial_1",
                                    "polynomial_2",
                                    "exp_polynomial_prod"),
@@ -307,6 +446,27 @@ def test_polynomial_mul(polynomial_1: list[Polynomial | int | float],
     assert polynomial_1 * polynomial_2 == exp_polynomial_prod
 
 
+@pytest.mark.parametrize(argnames=("polynomial_1", "polynomial_2", "exp_exponents"),
+                         argvalues=[
+    (Polynomial("x^3000000000"), Polynomial("2"), [[3000000000]]),
+    (Polynomial("x^2000000000"), Polynomial("x^2000000000"), [[4000000000]]),
+    (Polynomial("x^2147483000"), Polynomial("x^1000"), [[2147484000]]),
+    (Polynomial("x^2000000000 + y"), Polynomial("x^2000000000 + y"),
+     [[4000000000, 0], [2000000000, 1], [0, 2]]),
+])
+def test_polynomial_mul_large_exponents(polynomial_1: list[Polynomial],
+                                        polynomial_2: list[Polynomial],
+                                        exp_exponents: list[list[int]]) -> None:
+    """Tests products whose exponents don't fit in 32 bits."""
+    assert (polynomial_1 * polynomial_2)._exponents.tolist() == exp_exponents
+
+
+def test_polynomial_exponent_too_large() -> None:
+    """Tests that exponents which don't fit in 64 bits are rejected."""
+    with pytest.raises(ValueError, match="exponent 9223372036854775808 is too large"):
+        Polynomial("x^9223372036854775808")
+
+
 @pytest.mark.parametrize(argnames=("polynomial", "wrt", "result"), argvalues=[
     (Polynomial("0"), "x", Polynomial("0.0")),
     (Polynomial("1"), Indeterminate("x"), Polynomial("0")),
@@ -328,3 +488,131 @@ def test_polynomial_derivative(polynomial: list[Polynomial],
                              result: list[Polynomial]) -> None:
     """Tests some Polynomial derivatives."""
     assert polynomial.derivative(wrt) == result
+
+
+@pytest.mark.parametrize(argnames="polynomial", argvalues=[
+    Polynomial("x^2 + y^2 + z^2 + x*y + x*z + y*z + x + y + z + 1"),
+    Polynomial("a*h + b*g + c*f + d*e + a^2 + h^2 + a*b*c*d*e*f*g*h"),
+    Polynomial("x^255 + x^254*y + y^255"),
+])
+def test_polynomial_grevlex_keys(polynomial: list[Polynomial]) -> None:
+    """Tests that the packed grevlex keys sort the same way as the row sort."""
+    keys = Polynomial._grevlex_keys(polynomial._exponents)
+    assert np.argsort(keys)[::-1].tolist() \
+        == Polynomial._grevlex_order(polynomial._exponents).tolist()
+    assert sorted(polynomial._monomial_list(), reverse=True) \
+        == polynomial._monomial_list()
+
+
+def test_polynomial_grevlex_keys_too_wide() -> None:
+    """Tests that matrices too wide or of too high degree aren't packed."""
+    assert Polynomial._grevlex_keys(
+        Polynomial("a + b + c + d + e + f + g + h + i")._exponents) is None
+    assert Polynomial._grevlex_keys(Polynomial("x^128*y^128")._exponents) is None
+
+
+@pytest.mark.parametrize(argnames=("polynomial_1", "polynomial_2"), argvalues=[
+    (Polynomial("0"), Polynomial("0")),
+    (Polynomial("x + y"), Polynomial("-1*x + z")),
+    (Polynomial("x^3 + x^2*y + x*y*z + 4"), Polynomial("y^3 - x*y*z + 2*z - 4")),
+    (Polynomial("a + b + c + d + e + f + g + h + i"), Polynomial("a*b + i")),
+])
+def test_consolidate_presorted(polynomial_1: list[Polynomial],
+                               polynomial_2: list[Polynomial]) -> None:
+    """Tests that merging two sorted runs agrees with consolidating from scratch."""
+    _, exp_a, exp_b = polynomial_1._aligned_exponents(polynomial_2)
+    exponents = np.vstack([exp_a, exp_b])
+    coefficients = np.concatenate([polynomial_1._coefficients,
+                                   polynomial_2._coefficients])
+
+    merged = Polynomial._consolidate_exponents(exponents, coefficients,
+                                               presorted=True)
+    shuffled = np.random.default_rng(0).permutation(len(coefficients))
+    consolidated = Polynomial._consolidate_exponents(exponents[shuffled],
+                                                     coefficients[shuffled])
+    assert np.array_equal(merged[0], consolidated[0])
+    assert np.array_equal(merged[1], consolidated[1])
+
+
+@pytest.mark.parametrize(argnames=("polynomial", "values", "result"), argvalues=[
+    (Polynomial("0"), {}, 0),
+    (Polynomial("-3.5"), {"x": 2}, -3.5),
+    (Polynomial("x^3 - 2*x + 1"), {"x": 2}, 5),
+    (Polynomial("x^3 - 2*x + 1"), {"x": np.array([0, 1, 2])}, [1, 0, 5]),
+    (Polynomial("x^2 + 3*x*y - 2"), {"x": 2, "y": 3}, 20),
+    (Polynomial("x^2 + 3*x*y - 2"), {"x": 1, "y": np.array([0, 1, 2])}, [-1, 2, 5]),
+    (Polynomial("x*y*z"),
+     {"x": np.array([[1], [2]]), "y": np.array([1, 2, 3]), "z": -1},
+     [[-1, -2, -3], [-2, -4, -6]]),
+    (Polynomial("x - x^2*y") * Polynomial("y + 1"), {"x": 3, "y": -2, "z": 4}, -21),
+    (Polynomial("3"), {"x": np.arange(3)}, [3, 3, 3]),
+    (Polynomial("x") - Polynomial("x"), {"x": np.arange(3)}, [0, 0, 0]),
+    (Polynomial("x + 1"), {"x": 1, "y": np.arange(2)}, [2, 2]),
+    (Polynomial("self + 1"), {"self": 2}, 3),
+    (Polynomial("x^1000000 + 1"), {"x": np.array([0.5, 1])}, [1, 2]),
+    (Polynomial("x^50000000 - 2*x + 1"), {"x": np.array([-1, 1])}, [4, 0]),
+])
+def test_polynomial_call(polynomial: list[Polynomial],
+                         values: list[dict[str, float | np.ndarray]],
+                         result: list[float | list]) -> None:
+    """Tests some Polynomial evaluations, at single points and arrays of points."""
+    assert np.array_equal(polynomial(**values), result)
+
+
+def test_polynomial_call_missing_value() -> None:
+    """Tests that evaluating needs a value for every indeterminate."""
+    with pytest.raises(ValueError, match="Missing value for indeterminate 'y'!"):
+        Polynomial("x + y")(x=1)
+
+
+@pytest.mark.parametrize(argnames=("polynomial", "order", "exp_leading_term"),
+                         argvalues=[
+    (Polynomial("-3.5"), "lex", Monomial("-3.5")),
+    (Polynomial("-3.5"), "grlex", Monomial("-3.5")),
+    (Polynomial("-3.5"), "grevlex", Monomial("-3.5")),
+    (Polynomial("x + 2*y"), "grevlex", Monomial("x")),
+    (Polynomial("x*z^3 + x^2*y + y^4 - 2*z"), "lex", Monomial("x^2*y")),
+    (Polynomial("x*z^3 + x^2*y + y^4 - 2*z"), "grlex", Monomial("x*z^3")),
+    (Polynomial("x*z^3 + x^2*y + y^4 - 2*z"), "grevlex", Monomial("y^4")),
+    (Polynomial("4*x*y^2*z + 4*z^2 - 5*x^3 + 7*x^2*z^2"), "lex", Monomial("-5*x^3")),
+    (Polynomial("4*x*y^2*z + 4*z^2 - 5*x^3 + 7*x^2*z^2"), "grlex",
+     Monomial("7*x^2*z^2")),
+    (Polynomial("4*x*y^2*z + 4*z^2 - 5*x^3 + 7*x^2*z^2"), "grevlex",
+     Monomial("4*x*y^2*z")),
+])
+def test_polynomial_leading_term(polynomial: list[Polynomial],
+                                 order: list[str],
+                                 exp_leading_term: list[Monomial]) -> None:
+    """Tests some leading terms, monomials and coefficients in each order."""
+    assert polynomial.leading_term(order) == exp_leading_term
+    assert polynomial.leading_coefficient(order) == exp_leading_term.coefficient
+    assert polynomial.leading_monomial(order) \
+        == Monomial._from_parts(1., exp_leading_term.weight_dict)
+
+
+@pytest.mark.parametrize(argnames=("polynomial", "order", "exp_error_msg"),
+                         argvalues=[
+    (Polynomial("0"), "grevlex", "The zero polynomial has no leading monomial!"),
+    (Polynomial("x") - Polynomial("x"), "lex",
+     "The zero polynomial has no leading monomial!"),
+    (Polynomial("x + y"), "revlex", "Invalid monomial order 'revlex'!"),
+])
+def test_polynomial_leading_term_invalid(polynomial: list[Polynomial],
+                                         order: list[str],
+                                         exp_error_msg: list[str]) -> None:
+    """Tests that the zero polynomial and unknown orders have no leading term."""
+    with pytest.raises(ValueError, match=re.escape(exp_error_msg)):
+        polynomial.leading_term(order)
+
+
+@pytest.mark.parametrize(argnames="obj", argvalues=[
+    Monomial("-3*x^2*y"),
+    Polynomial("0"),
+    Polynomial("x^2 + 3*x*y - 2"),
+])
+def test_slotted_pickle(obj: list[Monomial | Polynomial]) -> None:
+    """Tests that Monomials and Polynomials have no __dict__, but still pickle."""
+    assert not hasattr(obj, "__dict__")
+    unpickled = pickle.loads(pickle.dumps(obj))  # noqa: S301
+    assert unpickled == obj
+    assert hash(unpickled) == hash(obj)
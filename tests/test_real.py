@@ -20,6 +20,8 @@ from symboliccomputation.number.real import Rational
     (-9, 60, -3, 20),
     (9, -60, -3, 20),
     (-9, -60, 3, 20),
+    (2**62 + 2, 2, 2**61 + 1, 1),
+    (-(2**62 + 2), -(2**62 + 4), 2**61 + 1, 2**61 + 2),
 ])
 def test_valid_rational_fraction(numerator: list[np.int64],
                                  denominator: list[np.int64],
@@ -30,6 +32,12 @@ def test_valid_rational_fraction(numerator: list[np.int64],
     assert rat.numerator == exp_num and rat.denominator == exp_denom
 
 
+def test_rational_zero_denominator() -> None:
+    """Tests that a zero denominator is rejected."""
+    with pytest.raises(ZeroDivisionError):
+        Rational(numerator=1, denominator=0)
+
+
 @pytest.mark.parametrize(argnames=("decimal", "exp_num", "exp_denom"),
                          argvalues=[
     (0.0, 0, 10),